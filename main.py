@@ -1,3 +1,5 @@
+from concurrent.futures import ProcessPoolExecutor
+
 from src.prepare_data.create_files import main as prepare_data_main
 from src.explode_form_responses.pivot_form_responses_participants import pivot_table_and_save_to_excel as pivot_table_export
 from src.random_sort_visiteurs.run_lottery import main as random_sort
@@ -6,6 +8,10 @@ from loguru import logger
 
 if __name__ == "__main__":
     prepare_data_main()
-    pivot_table_export()
-    random_sort()
+    # Le pivot et le tirage lisent des fichiers différents : le pivot tourne dans
+    # un processus séparé pendant que le tirage (interactif, il lit stdin) reste ici.
+    with ProcessPoolExecutor(max_workers=1) as executor:
+        pivot_future = executor.submit(pivot_table_export)
+        random_sort()
+        pivot_future.result()
     logger.info("All tasks completed successfully.")
\ No newline at end of file
@@ -0,0 +1,22 @@
+import numpy as np
+from numba import njit
+
+# ================================================================================
+# NOYAUX COMPILÉS (NUMBA) POUR L'ÉCLATEMENT DES COLONNES DE LISTES
+# ================================================================================
+
+@njit(cache=True, boundscheck=False)
+def pad_lists(values: np.ndarray, offsets: np.ndarray, out: np.ndarray) -> None:
+    """
+    Recopie chaque liste values[offsets[i]:offsets[i+1]] dans la ligne i de `out`
+
+    Args:
+        values: Buffer plat et typé des valeurs (ex: codes int32)
+        offsets: Offsets au format Arrow (nombre de lignes + 1 éléments)
+        out: Tableau (lignes, longueur_max) pré-rempli avec la valeur de remplissage
+    """
+    for i in range(out.shape[0]):
+        start = offsets[i]
+        end = offsets[i + 1]
+        for j in range(end - start):
+            out[i, j] = values[start + j]
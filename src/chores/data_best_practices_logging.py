@@ -1,72 +1,172 @@
 import pandas as pd
 import numpy as np
+import pyarrow as pa
+import pyarrow.compute as pc
 from loguru import logger
 from icecream import ic
 import sys
-from typing import Union, List, Optional, Tuple
+from typing import Union, List, Optional, Tuple, Dict
 import warnings
 from pathlib import Path
 import time
+import weakref
+
+from src.chores._explode_kernels import pad_lists
 
 # ================================================================================
 # CONFIGURATION LOGGING AVEC LOGURU
 # ================================================================================
 
-# Supprimer le handler par défaut de loguru
-logger.remove()
-
-# Configuration personnalisée de loguru
-logger.add(
-    sys.stderr,  # Sortie console
-    format="<green>{time:YYYY-MM-DD HH:mm:ss}</green> | <level>{level: <8}</level> | <cyan>{name}</cyan>:<cyan>{function}</cyan>:<cyan>{line}</cyan> - <level>{message}</level>",
-    level="DEBUG",
-    colorize=True
-)
+def configure_logging() -> None:
+    """
+    Configure loguru (console + fichiers) et icecream
+    
+    À appeler une seule fois depuis le point d'entrée : l'import du module
+    n'a ainsi aucun effet de bord (handlers, création de fichiers de log).
+    """
+    # Créer le répertoire de logs s'il n'existe pas
+    Path("logs").mkdir(exist_ok=True)
+    
+    # Supprimer le handler par défaut de loguru
+    logger.remove()
+    
+    # Configuration personnalisée de loguru
+    logger.add(
+        sys.stderr,  # Sortie console
+        format="<green>{time:YYYY-MM-DD HH:mm:ss}</green> | <level>{level: <8}</level> | <cyan>{name}</cyan>:<cyan>{function}</cyan>:<cyan>{line}</cyan> - <level>{message}</level>",
+        level="DEBUG",
+        colorize=True,
+        enqueue=True  # Écriture en arrière-plan : le traitement n'attend pas les I/O
+    )
+    
+    # Fichier de log pour les erreurs critiques
+    logger.add(
+        "logs/data_processing_errors.log",
+        format="{time:YYYY-MM-DD HH:mm:ss} | {level} | {name}:{function}:{line} - {message}",
+        level="ERROR",
+        rotation="10 MB",  # Rotation tous les 10MB
+        retention="30 days",  # Garde 30 jours
+        compression="zip",  # Compression des anciens logs
+        enqueue=True
+    )
+    
+    # Fichier de log pour tout le processus
+    logger.add(
+        "logs/data_processing_full.log",
+        format="{time:YYYY-MM-DD HH:mm:ss} | {level} | {name}:{function}:{line} - {message}",
+        level="INFO",
+        rotation="1 day",
+        retention="7 days",
+        enqueue=True
+    )
+    
+    # Configuration d'icecream
+    ic.configureOutput(prefix='🔍 DEBUG | ', includeContext=True)
 
-# Fichier de log pour les erreurs critiques
-logger.add(
-    "logs/data_processing_errors.log",
-    format="{time:YYYY-MM-DD HH:mm:ss} | {level} | {name}:{function}:{line} - {message}",
-    level="ERROR",
-    rotation="10 MB",  # Rotation tous les 10MB
-    retention="30 days",  # Garde 30 jours
-    compression="zip"  # Compression des anciens logs
-)
+# ================================================================================
+# CACHE PAR DATAFRAME (ACCESSEUR PANDAS)
+# ================================================================================
 
-# Fichier de log pour tout le processus
-logger.add(
-    "logs/data_processing_full.log",
-    format="{time:YYYY-MM-DD HH:mm:ss} | {level} | {name}:{function}:{line} - {message}",
-    level="INFO",
-    rotation="1 day",
-    retention="7 days"
-)
+# Caches indexés par id(DataFrame), hors de l'accesseur : selon la version de pandas,
+# `df.rlq` peut renvoyer un nouvel accesseur à chaque accès. Un DataFrame n'est pas
+# hachable (pas de WeakKeyDictionary possible) : l'entrée est supprimée par
+# weakref.finalize à la destruction du DataFrame, avant toute réutilisation de son id.
+_RLQ_CACHES: Dict[int, dict] = {}
 
-# Configuration d'icecream
-ic.configureOutput(prefix='🔍 DEBUG | ', includeContext=True)
+@pd.api.extensions.register_dataframe_accessor("rlq")
+class RlqAccessor:
+    """
+    Accesseur `df.rlq` mémorisant la validation des colonnes de listes d'un DataFrame
+    
+    Le cache est associé à l'objet DataFrame : toute transformation qui renvoie
+    un nouveau DataFrame repart d'un cache vide. Une colonne remplacée est
+    détectée automatiquement ; après une modification en place des valeurs,
+    appeler `df.rlq.reset()`.
+    """
+    
+    def __init__(self, df: pd.DataFrame):
+        self._df = df
+    
+    @property
+    def _cache(self) -> dict:
+        """Retourne (en le créant si besoin) le cache du DataFrame"""
+        key = id(self._df)
+        cache = _RLQ_CACHES.get(key)
+        if cache is None:
+            cache = {"validated": {}}
+            _RLQ_CACHES[key] = cache
+            weakref.finalize(self._df, _RLQ_CACHES.pop, key, None)
+        return cache
+    
+    @staticmethod
+    def _series_buffer(series: pd.Series) -> object:
+        """Retourne l'objet propriétaire des données (tableau NumPy ou ExtensionArray)"""
+        values = series.array
+        if isinstance(values, pd.arrays.NumpyExtensionArray):
+            values = values.to_numpy()
+            return values if values.base is None else values.base
+        return values
+    
+    def _column_buffer(self, column_name: str) -> object:
+        """Retourne l'objet propriétaire des données de la colonne"""
+        return self._series_buffer(self._df[column_name])
+    
+    def get_validation(self, column_name: str) -> Optional[tuple]:
+        """
+        Retourne le résultat de validation mémorisé pour une colonne
+        
+        Returns:
+            Optional[tuple]: Résultat de validate_list_column, ou None si absent/périmé
+        """
+        validated = self._cache["validated"]
+        entry = validated.get(column_name)
+        if entry is None:
+            return None
+        buffer, result = entry
+        if column_name not in self._df.columns or buffer is not self._column_buffer(column_name):
+            del validated[column_name]
+            return None
+        return result
+    
+    def set_validation(self, column_name: str, result: tuple) -> None:
+        """Mémorise le résultat de validate_list_column pour une colonne"""
+        self._cache["validated"][column_name] = (self._column_buffer(column_name), result)
+    
+    def reset(self) -> None:
+        """Vide le cache"""
+        _RLQ_CACHES.pop(id(self._df), None)
 
 # ================================================================================
 # FONCTIONS UTILITAIRES DE VALIDATION ET LOGGING
 # ================================================================================
 
-def log_dataframe_info(df: pd.DataFrame, step_name: str) -> None:
+def log_dataframe_info(df: pd.DataFrame, step_name: str, verbose_memory: bool = False,
+                       missing_counts: Optional[pd.Series] = None) -> None:
     """
     Log des informations détaillées sur un DataFrame
     
     Args:
         df: DataFrame à analyser
         step_name: Nom de l'étape pour identifier dans les logs
+        verbose_memory: Si True, calcule la mémoire exacte (deep=True, coûteux
+            sur les colonnes object) au lieu d'une estimation sur la première ligne
+        missing_counts: Résultat de df.isnull().sum() déjà calculé par l'appelant
+            (recalculé si absent)
     """
     logger.info(f"=== ANALYSE DATAFRAME - {step_name.upper()} ===")
     logger.info(f"Forme: {df.shape} (lignes: {df.shape[0]}, colonnes: {df.shape[1]})")
-    logger.info(f"Mémoire utilisée: {df.memory_usage(deep=True).sum() / 1024**2:.2f} MB")
+    if verbose_memory:
+        logger.info(f"Mémoire utilisée: {df.memory_usage(deep=True).sum() / 1024**2:.2f} MB")
+    else:
+        approx = df.head(1).memory_usage(index=False, deep=True).sum() * len(df)
+        logger.info(f"Mémoire utilisée (estimation): {approx / 1024**2:.2f} MB")
     
     # Types de données
     types_info = df.dtypes.value_counts().to_dict()
     logger.info(f"Types de données: {types_info}")
     
     # Valeurs manquantes
-    missing_info = df.isnull().sum()
+    missing_info = df.isnull().sum() if missing_counts is None else missing_counts
     if missing_info.sum() > 0:
         logger.warning(f"Valeurs manquantes détectées:")
         for col, count in missing_info[missing_info > 0].items():
@@ -82,7 +182,99 @@ def log_dataframe_info(df: pd.DataFrame, step_name: str) -> None:
     else:
         logger.info("Aucun doublon détecté")
 
-def validate_list_column(df: pd.DataFrame, column_name: str) -> Tuple[bool, List[str]]:
+def _list_lengths(col: pd.Series, is_list: Optional[np.ndarray] = None) -> np.ndarray:
+    """
+    Calcule la longueur de chaque liste d'une colonne en une seule passe
+    
+    Args:
+        col: Série contenant des listes
+        is_list: Masque des éléments de type liste (recalculé si absent)
+    
+    Returns:
+        np.ndarray: Longueurs (0 pour les valeurs qui ne sont pas des listes)
+    """
+    if is_list is None:
+        is_list = col.map(type).eq(list).to_numpy()
+    lengths = np.zeros(len(col), dtype=np.int64)
+    # len() direct : l'accesseur .str n'existe pas sur les colonnes non object (float, int)
+    lengths[is_list] = np.fromiter(
+        map(len, col.to_numpy()[is_list]), dtype=np.int64, count=int(is_list.sum())
+    )
+    return lengths
+
+def _list_column_to_arrow(col: pd.Series) -> Optional[pa.ListArray]:
+    """
+    Convertit une colonne de listes Python en ListArray Arrow (valeurs contiguës + offsets)
+    
+    Args:
+        col: Série contenant des listes
+    
+    Returns:
+        Optional[pa.ListArray]: Les valeurs qui ne sont pas des listes deviennent null
+            (longueur 0) ; None si les éléments mélangent des types qu'Arrow ne sait pas typer
+    """
+    is_list = col.map(type).eq(list).to_numpy()
+    items = np.where(is_list, col.to_numpy(), None)
+    try:
+        list_array = pa.array(items, from_pandas=True)
+    except (pa.ArrowInvalid, pa.ArrowTypeError):  # Ex: [[1, 'a'], [2, 'b']]
+        return None
+    if not pa.types.is_list(list_array.type):  # Aucune liste : Arrow infère le type null
+        list_array = pa.array(items, type=pa.list_(pa.null()))
+    return list_array
+
+def _pad_object_lists(col: pd.Series, max_length: int) -> np.ndarray:
+    """
+    Construit le tableau 2D complété par NaN directement à partir des listes Python
+    
+    Chemin de repli pour les listes aux types mixtes, non convertibles en Arrow.
+    
+    Args:
+        col: Série contenant des listes
+        max_length: Longueur cible des lignes
+    
+    Returns:
+        np.ndarray: Tableau object de forme (lignes, max_length)
+    """
+    out = np.full((len(col), max_length), np.nan, dtype=object)
+    for i, value in enumerate(col.to_numpy()):
+        if isinstance(value, list):
+            out[i, :len(value)] = value
+    return out
+
+def _pad_list_array(list_array: pa.ListArray, max_length: int) -> np.ndarray:
+    """
+    Construit le tableau 2D complété par NaN à partir d'un ListArray Arrow
+    
+    Les valeurs sont encodées en codes int32 (dictionnaire) pour que le noyau
+    numba travaille sur un buffer typé, puis décodées en une seule indexation.
+    
+    Args:
+        list_array: Colonne de listes au format Arrow
+        max_length: Longueur cible des lignes
+    
+    Returns:
+        np.ndarray: Tableau de forme (lignes, max_length) ; float pour des valeurs
+            numériques (le NaN de remplissage impose un type flottant), object sinon
+    """
+    if max_length == 0:
+        return np.empty((len(list_array), 0), dtype=object)
+    
+    encoded = pc.dictionary_encode(list_array.values)
+    codes = encoded.indices.fill_null(-1).to_numpy()
+    dictionary = encoded.dictionary.to_numpy(zero_copy_only=False)
+    if dictionary.dtype.kind in "iuf":
+        dictionary = dictionary.astype(np.result_type(dictionary.dtype, np.float64))
+    else:
+        dictionary = dictionary.astype(object)
+    # Le code -1 (remplissage) pointe sur le NaN ajouté en fin de dictionnaire
+    dictionary = np.append(dictionary, np.nan)
+    
+    out_codes = np.full((len(list_array), max_length), -1, dtype=np.int32)
+    pad_lists(codes, list_array.offsets.to_numpy(), out_codes)
+    return dictionary[out_codes]
+
+def validate_list_column(df: pd.DataFrame, column_name: str) -> Tuple[bool, List[str], np.ndarray]:
     """
     Valide qu'une colonne contient bien des listes et retourne les problèmes détectés
     
@@ -91,48 +283,51 @@ def validate_list_column(df: pd.DataFrame, column_name: str) -> Tuple[bool, List
         column_name: Nom de la colonne à vérifier
     
     Returns:
-        Tuple[bool, List[str]]: (is_valid, liste_des_erreurs)
+        Tuple[bool, List[str], np.ndarray]: (is_valid, liste_des_erreurs, longueurs_des_listes)
     """
     errors = []
     
     # Vérification de l'existence de la colonne
     if column_name not in df.columns:
         errors.append(f"Colonne '{column_name}' introuvable")
-        return False, errors
-    
-    # Vérification du type des éléments
-    non_list_count = 0
-    empty_list_count = 0
-    length_variations = []
-    
-    for idx, value in enumerate(df[column_name]):
-        if pd.isna(value):
+        return False, errors, np.empty(0, dtype=np.int64)
+    
+    # Vérification du type des éléments (masques vectorisés, sans boucle Python)
+    col = df[column_name]
+    is_list = col.map(type).eq(list).to_numpy()
+    is_nan = col.isna().to_numpy()
+    non_list_mask = ~is_list & ~is_nan
+    non_list_count = int(non_list_mask.sum())
+    
+    # Conserve l'ordre des index : NaN et premiers types incorrects (limités dans les logs)
+    nan_positions = np.flatnonzero(is_nan)
+    bad_positions = np.flatnonzero(non_list_mask)[:5]
+    for idx in np.union1d(nan_positions, bad_positions):
+        if is_nan[idx]:
             errors.append(f"Valeur NaN à l'index {idx}")
-        elif not isinstance(value, list):
-            non_list_count += 1
-            if non_list_count <= 5:  # Limite les exemples dans les logs
-                errors.append(f"Type incorrect à l'index {idx}: {type(value)} - {value}")
         else:
-            if len(value) == 0:
-                empty_list_count += 1
-            length_variations.append(len(value))
+            value = col.iat[idx]
+            errors.append(f"Type incorrect à l'index {idx}: {type(value)} - {value}")
     
     # Résumé des problèmes
     if non_list_count > 5:
         errors.append(f"... et {non_list_count - 5} autres valeurs de type incorrect")
     
+    lengths = _list_lengths(col, is_list)
+    list_lengths = lengths[is_list]
+    empty_list_count = int((list_lengths == 0).sum())
     if empty_list_count > 0:
         errors.append(f"{empty_list_count} listes vides détectées")
     
     # Vérification de la cohérence des longueurs
-    if length_variations:
-        min_len, max_len = min(length_variations), max(length_variations)
+    if list_lengths.size:
+        min_len, max_len = int(np.min(list_lengths)), int(np.max(list_lengths))
         if min_len != max_len:
             logger.warning(f"Longueurs variables détectées: min={min_len}, max={max_len}")
-            ic(min_len, max_len, np.mean(length_variations))
+            logger.opt(lazy=True).debug("Longueur moyenne des listes: {}", lambda: np.mean(list_lengths))
     
     is_valid = len(errors) == 0
-    return is_valid, errors
+    return is_valid, errors, lengths
 
 def safe_explode_column(df: pd.DataFrame, column_name: str, 
                        prefix: str = "col", validate: bool = True) -> pd.DataFrame:
@@ -155,7 +350,14 @@ def safe_explode_column(df: pd.DataFrame, column_name: str,
         # Étape 1: Validation des données
         if validate:
             logger.info("Validation des données...")
-            is_valid, errors = validate_list_column(df, column_name)
+            cached_validation = df.rlq.get_validation(column_name)
+            if cached_validation is not None:
+                logger.info("Colonne déjà validée - résultat mémorisé réutilisé")
+                is_valid, errors, lengths = cached_validation
+            else:
+                is_valid, errors, lengths = validate_list_column(df, column_name)
+                if column_name in df.columns:
+                    df.rlq.set_validation(column_name, (is_valid, errors, lengths))
             
             if not is_valid:
                 logger.error("Erreurs de validation détectées:")
@@ -168,44 +370,64 @@ def safe_explode_column(df: pd.DataFrame, column_name: str,
         # Étape 2: Analyse des données
         log_dataframe_info(df, "avant_eclatement")
         
-        # Étape 3: Traitement des listes
+        # Étape 3: Traitement des listes (disposition Arrow : buffer de valeurs + offsets)
         logger.info("Analyse des longueurs de listes...")
-        lengths = df[column_name].apply(lambda x: len(x) if isinstance(x, list) else 0)
-        max_length = lengths.max()
-        unique_lengths = lengths.unique()
+        list_array = _list_column_to_arrow(df[column_name])
+        if not validate:
+            if list_array is None:
+                lengths = _list_lengths(df[column_name])
+            else:
+                lengths = np.diff(list_array.offsets.to_numpy())
+        max_length = int(lengths.max()) if lengths.size else 0
+        unique_lengths = np.unique(lengths)
         
-        ic(max_length, unique_lengths, lengths.describe())
+        logger.opt(lazy=True).debug(
+            "max_length={}, unique_lengths={}\n{}",
+            lambda: max_length, lambda: unique_lengths, lambda: pd.Series(lengths).describe()
+        )
         
-        # Étape 4: Normalisation si nécessaire
-        if len(unique_lengths) > 1:
+        # Étape 4: Normalisation si nécessaire (noyau numba sur le buffer Arrow)
+        if list_array is None:
+            logger.warning("Types mixtes dans les listes - éclatement sur les objets Python")
+            out = _pad_object_lists(df[column_name], max_length)
+        elif len(unique_lengths) > 1:
             logger.warning("Longueurs variables détectées - normalisation nécessaire")
-            
-            def normalize_list(lst, target_length):
-                if not isinstance(lst, list):
-                    return [np.nan] * target_length
-                normalized = lst.copy()
-                while len(normalized) < target_length:
-                    normalized.append(np.nan)
-                return normalized
-            
-            normalized_lists = df[column_name].apply(lambda x: normalize_list(x, max_length))
+            out = _pad_list_array(list_array, max_length)
             logger.info(f"Normalisation effectuée vers {max_length} éléments")
         else:
-            normalized_lists = df[column_name]
+            # Listes de même longueur : le buffer de valeurs se redimensionne directement en 2D
+            offsets = list_array.offsets.to_numpy()
+            values = list_array.values.to_numpy(zero_copy_only=False)
+            out = values[offsets[0]:offsets[-1]].reshape(len(df), max_length)
             logger.info("Aucune normalisation nécessaire")
         
         # Étape 5: Création du DataFrame éclaté
         logger.info("Création des nouvelles colonnes...")
-        exploded_df = pd.DataFrame(normalized_lists.tolist())
-        exploded_df.columns = [f'{prefix}_{i+1}' for i in range(exploded_df.shape[1])]
+        # `out` est déjà un bloc 2D : le DataFrame l'utilise tel quel, sans recopie
+        exploded_df = pd.DataFrame(
+            out,
+            columns=[f'{prefix}_{i+1}' for i in range(max_length)],
+            index=df.index,
+            copy=False
+        )
+        if list_array is None:
+            # Types déduits colonne par colonne (ex: entiers d'un côté, textes de l'autre)
+            exploded_df = exploded_df.infer_objects()
         
-        ic(exploded_df.shape, exploded_df.columns.tolist())
+        logger.opt(lazy=True).debug(
+            "exploded_df: forme={}, colonnes={}",
+            lambda: exploded_df.shape, lambda: exploded_df.columns.tolist()
+        )
         
-        # Étape 6: Concaténation
-        logger.info("Concaténation avec le DataFrame original...")
-        result_df = pd.concat([df.drop(column_name, axis=1), exploded_df], axis=1)
+        # Étape 6: Ajout des colonnes au DataFrame original (sans concaténation)
+        logger.info("Ajout des nouvelles colonnes au DataFrame original...")
+        result_df = df.drop(columns=[column_name])
+        # Le DataFrame est affecté tel quel pour conserver le type de chaque colonne
+        result_df[list(exploded_df.columns)] = exploded_df
         
         # Étape 7: Validation finale
+        # Seules les colonnes créées sont optimisées : celles de l'appelant restent intactes
+        result_df = optimize_dtypes(result_df, columns=list(exploded_df.columns))
         log_dataframe_info(result_df, "après_eclatement")
         
         execution_time = time.time() - start_time
@@ -223,10 +445,15 @@ def safe_explode_column(df: pd.DataFrame, column_name: str,
 # FONCTIONS DE NETTOYAGE ET VALIDATION AVANCÉES
 # ================================================================================
 
-def detect_data_quality_issues(df: pd.DataFrame) -> dict:
+def detect_data_quality_issues(df: pd.DataFrame, missing_counts: Optional[pd.Series] = None) -> dict:
     """
     Détecte automatiquement les problèmes de qualité des données
     
+    Args:
+        df: DataFrame à analyser
+        missing_counts: Résultat de df.isnull().sum() déjà calculé par l'appelant
+            (recalculé si absent)
+    
     Returns:
         dict: Dictionnaire avec les problèmes détectés
     """
@@ -234,7 +461,7 @@ def detect_data_quality_issues(df: pd.DataFrame) -> dict:
     issues = {}
     
     # 1. Valeurs manquantes
-    missing = df.isnull().sum()
+    missing = df.isnull().sum() if missing_counts is None else missing_counts
     if missing.sum() > 0:
         issues['missing_values'] = missing[missing > 0].to_dict()
         logger.warning(f"Valeurs manquantes: {missing.sum()} au total")
@@ -248,25 +475,71 @@ def detect_data_quality_issues(df: pd.DataFrame) -> dict:
     # 3. Types de données incohérents
     for col in df.columns:
         if df[col].dtype == 'object':
-            unique_types = set(type(x).__name__ for x in df[col].dropna())
-            if len(unique_types) > 1:
-                issues[f'mixed_types_{col}'] = list(unique_types)
+            types = df[col].dropna().map(type)
+            # nunique est peu coûteux : on ne matérialise les types que s'ils diffèrent
+            if types.nunique() > 1:
+                unique_types = [t.__name__ for t in types.unique()]
+                issues[f'mixed_types_{col}'] = unique_types
                 logger.warning(f"Types mixtes dans '{col}': {unique_types}")
     
     # 4. Valeurs aberrantes pour les colonnes numériques
     numeric_cols = df.select_dtypes(include=[np.number]).columns
-    for col in numeric_cols:
-        Q1 = df[col].quantile(0.25)
-        Q3 = df[col].quantile(0.75)
+    if len(numeric_cols) > 0:
+        numeric_df = df[numeric_cols]
+        quantiles = numeric_df.quantile([0.25, 0.75])
+        Q1, Q3 = quantiles.loc[0.25], quantiles.loc[0.75]
         IQR = Q3 - Q1
-        outliers = df[(df[col] < Q1 - 1.5 * IQR) | (df[col] > Q3 + 1.5 * IQR)][col]
-        if len(outliers) > 0:
-            issues[f'outliers_{col}'] = len(outliers)
-            logger.warning(f"Valeurs aberrantes dans '{col}': {len(outliers)} valeurs")
+        outliers_mask = numeric_df.lt(Q1 - 1.5 * IQR) | numeric_df.gt(Q3 + 1.5 * IQR)
+        outlier_counts = outliers_mask.sum(axis=0)
+        for col, count in outlier_counts[outlier_counts > 0].items():
+            issues[f'outliers_{col}'] = int(count)
+            logger.warning(f"Valeurs aberrantes dans '{col}': {count} valeurs")
     
-    ic(issues)
+    logger.opt(lazy=True).debug("Problèmes détectés: {}", lambda: issues)
     return issues
 
+def optimize_dtypes(df: pd.DataFrame, category_ratio: float = 0.5,
+                    columns: Optional[List[str]] = None) -> pd.DataFrame:
+    """
+    Réduit l'empreinte mémoire d'un DataFrame en optimisant ses types
+    
+    Args:
+        df: DataFrame à optimiser
+        category_ratio: Ratio valeurs uniques / lignes sous lequel une colonne
+            object est convertie en category
+        columns: Colonnes à optimiser (toutes par défaut)
+    
+    Returns:
+        pd.DataFrame: DataFrame avec types numériques réduits et colonnes category
+    """
+    df_optimized = df.copy(deep=False)
+    subset = df_optimized if columns is None else df_optimized[list(columns)]
+    
+    # Réduction des types numériques (ex: int64 -> int8). Un flottant n'est réduit
+    # que si toutes ses valeurs survivent exactement au passage en float32.
+    for col in subset.select_dtypes(include=[np.number]).columns:
+        values = df_optimized[col]
+        if pd.api.types.is_integer_dtype(values):
+            df_optimized[col] = pd.to_numeric(values, downcast='integer')
+        elif pd.api.types.is_float_dtype(values):
+            downcasted = pd.to_numeric(values, downcast='float')
+            if np.array_equal(
+                downcasted.to_numpy(dtype=values.dtype), values.to_numpy(), equal_nan=True
+            ):
+                df_optimized[col] = downcasted
+    
+    # Conversion des colonnes texte peu variées en category
+    if len(df_optimized) > 0:
+        for col in subset.select_dtypes(include=['object']).columns:
+            try:
+                n_unique = df_optimized[col].nunique()
+            except TypeError:  # Valeurs non hachables (listes...)
+                continue
+            if n_unique / len(df_optimized) < category_ratio:
+                df_optimized[col] = df_optimized[col].astype('category')
+    
+    return df_optimized
+
 def clean_dataframe(df: pd.DataFrame, cleaning_config: dict = None) -> pd.DataFrame:
     """
     Nettoie un DataFrame selon une configuration donnée
@@ -284,7 +557,8 @@ def clean_dataframe(df: pd.DataFrame, cleaning_config: dict = None) -> pd.DataFr
         }
     
     logger.info("Début du nettoyage des données")
-    df_clean = df.copy()
+    # Pas de copie préalable : chaque étape renvoie un nouveau DataFrame
+    df_clean = df
     
     # Suppression des doublons
     if cleaning_config.get('remove_duplicates', False):
@@ -308,9 +582,11 @@ def clean_dataframe(df: pd.DataFrame, cleaning_config: dict = None) -> pd.DataFr
     # Normalisation des chaînes de caractères
     if cleaning_config.get('normalize_strings', False):
         string_cols = df_clean.select_dtypes(include=['object']).columns
+        # Copie superficielle puis affectation : fonctionne quels que soient les libellés
+        # de colonnes (assign(**...) n'accepte que des noms de type str)
+        df_clean = df_clean.copy(deep=False)
         for col in string_cols:
-            if df_clean[col].dtype == 'object':
-                df_clean[col] = df_clean[col].astype(str).str.strip().str.lower()
+            df_clean[col] = df_clean[col].astype(str).str.strip().str.lower()
         logger.info(f"Normalisation des chaînes effectuée sur {len(string_cols)} colonnes")
     
     log_dataframe_info(df_clean, "après_nettoyage")
@@ -348,10 +624,12 @@ def main_example():
         
         # Étape 1: Analyse initiale
         logger.info("Analyse initiale des données")
-        log_dataframe_info(df, "données_brutes")
+        # Valeurs manquantes comptées une seule fois pour l'analyse et la détection
+        missing_brutes = df.isnull().sum()
+        log_dataframe_info(df, "données_brutes", missing_counts=missing_brutes)
         
         # Étape 2: Détection des problèmes de qualité
-        issues = detect_data_quality_issues(df)
+        issues = detect_data_quality_issues(df, missing_counts=missing_brutes)
         
         # Étape 3: Nettoyage préliminaire
         logger.info("Nettoyage préliminaire...")
@@ -389,7 +667,7 @@ def main_example():
         # Création du répertoire si nécessaire
         Path(output_path).parent.mkdir(parents=True, exist_ok=True)
         
-        df_result.to_csv(output_path, index=False)
+        df_result.to_csv(output_path, index=False, chunksize=100_000)
         logger.success(f"Données sauvegardées: {df_result.shape[0]} lignes, {df_result.shape[1]} colonnes")
         
         return df_result
@@ -481,8 +759,9 @@ def print_best_practices():
 # ================================================================================
 
 if __name__ == "__main__":
-    # Créer les répertoires de logs s'ils n'existent pas
-    Path("logs").mkdir(exist_ok=True)
+    # À lancer depuis la racine du projet : python -m src.chores.data_best_practices_logging
+    # Configurer le logging (crée aussi le répertoire de logs)
+    configure_logging()
     Path("data_processed").mkdir(exist_ok=True)
     
     # Afficher les bonnes pratiques
@@ -90,7 +90,7 @@ print(df_variable)
 print()
 
 # Trouver la longueur maximale des listes
-max_longueur = max(len(liste) for liste in df_variable['reponses_formulaire'])
+max_longueur = int(df_variable['reponses_formulaire'].str.len().max())
 print(f"Longueur maximale des listes : {max_longueur}")
 
 # Fonction pour normaliser les listes (compléter avec NaN si nécessaire)
@@ -147,15 +147,12 @@ def eclater_colonne_liste(df, nom_colonne, prefixe_nouvelles_colonnes='col',
     if nom_colonne not in df.columns:
         raise ValueError(f"La colonne '{nom_colonne}' n'existe pas dans le DataFrame")
     
-    # Copier le DataFrame pour éviter les modifications inattendues
-    df_resultat = df.copy()
-    
     # Obtenir les listes de la colonne
-    listes = df_resultat[nom_colonne]
+    listes = df[nom_colonne]
     
     if normaliser:
         # Trouver la longueur maximale
-        longueur_max = max(len(liste) if isinstance(liste, list) else 0 for liste in listes)
+        longueur_max = int(listes.str.len().fillna(0).max())
         
         # Normaliser les listes
         listes_normalisees = listes.apply(
@@ -163,23 +160,27 @@ def eclater_colonne_liste(df, nom_colonne, prefixe_nouvelles_colonnes='col',
         )
         
         # Convertir en DataFrame
-        colonnes_eclatees = pd.DataFrame(listes_normalisees.tolist())
+        colonnes_eclatees = pd.DataFrame(listes_normalisees.tolist(), index=df.index)
     else:
         # Conversion directe sans normalisation
-        colonnes_eclatees = pd.DataFrame(listes.tolist())
+        colonnes_eclatees = pd.DataFrame(listes.tolist(), index=df.index)
     
     # Nommer les colonnes
     nb_colonnes = colonnes_eclatees.shape[1]
     colonnes_eclatees.columns = [f'{prefixe_nouvelles_colonnes}_{i+1}' for i in range(nb_colonnes)]
     
-    # Supprimer la colonne d'origine si demandé
+    # Supprimer la colonne d'origine si demandé (drop renvoie déjà un nouveau
+    # DataFrame ; sinon une copie superficielle protège l'original)
     if supprimer_colonne_origine:
-        df_resultat = df_resultat.drop(nom_colonne, axis=1)
+        df_resultat = df.drop(nom_colonne, axis=1)
+    else:
+        df_resultat = df.copy(deep=False)
     
-    # Concaténer les résultats
-    df_final = pd.concat([df_resultat, colonnes_eclatees], axis=1)
+    # Ajouter les nouvelles colonnes directement (évite la copie d'un pd.concat) ;
+    # le DataFrame est affecté tel quel pour conserver le type de chaque colonne
+    df_resultat[list(colonnes_eclatees.columns)] = colonnes_eclatees
     
-    return df_final
+    return df_resultat
 
 # Test de la fonction générique
 print("Test de la fonction générique :")
@@ -1,43 +1,53 @@
 import pandas as pd
+import numpy as np
+from pathlib import Path
 
 try:
     # --- 1. Charger et préparer les données ---
     file_path = '/media/sacha/DATA_P21/projet_RLQ_Odoo_test/output_files/event_registration_cleaned.xlsx'
-    df = pd.read_excel(file_path)
+    parquet_path = Path(file_path).with_suffix('.parquet')
+
+    # Conversion unique en Parquet : les exécutions suivantes évitent le parseur XLSX
+    if not parquet_path.exists() or parquet_path.stat().st_mtime < Path(file_path).stat().st_mtime:
+        df = pd.read_excel(file_path)
+        df.to_parquet(parquet_path, compression='zstd')
+    else:
+        df = pd.read_parquet(parquet_path, engine='pyarrow')
 
     # On propage les informations du participant sur les lignes suivantes
     cols_to_fill = ['nom_du_participant', 'email']
-    df[cols_to_fill] = df[cols_to_fill].fillna(method='ffill')
+    df[cols_to_fill] = df[cols_to_fill].ffill()
 
     # On garde uniquement les colonnes nécessaires et on supprime les lignes sans réponse
-    df_responses = df[['nom_du_participant', 'email', 'reponses_des_participants']].copy()
-    df_responses.dropna(subset=['reponses_des_participants'], inplace=True)
+    # (ainsi que celles sans participant identifié, que le pivot ignorait déjà)
+    cles_participant = ['nom_du_participant', 'email']
+    df_responses = df[cles_participant + ['reponses_des_participants']].dropna()
 
 
-    # --- 2. Numéroter les réponses pour chaque participant ---
-    df_responses['num_reponse'] = df_responses.groupby(['nom_du_participant', 'email']).cumcount()
+    # --- 2. Numéroter les participants et leurs réponses ---
+    # ngroup : numéro de ligne du participant, cumcount : numéro de la réponse
+    groupes = df_responses.groupby(cles_participant, sort=False)
+    num_participant = groupes.ngroup().to_numpy()
+    num_reponse = groupes.cumcount().to_numpy()
 
 
     # --- 3. Pivoter les données ---
-    # Index : ce qui reste en lignes (nos participants)
-    # Columns : ce qui devient des colonnes (nos numéros de réponse)
-    # Values : les valeurs à mettre dans les nouvelles colonnes
-    df_pivot = df_responses.pivot_table(
-        index=['nom_du_participant', 'email'],
-        columns='num_reponse',
-        values='reponses_des_participants',
-        aggfunc='first'  # On prend la première valeur (il ne devrait y en avoir qu'une)
+    # Le tableau final est dense : on alloue (participants x réponses) et on
+    # place chaque réponse directement à sa position, sans passer par pivot_table.
+    _, premieres_lignes = np.unique(num_participant, return_index=True)
+    reponses = np.full((len(premieres_lignes), num_reponse.max() + 1), np.nan, dtype=object)
+    reponses[num_participant, num_reponse] = df_responses['reponses_des_participants'].to_numpy()
+
+
+    # --- 4. Nommer les nouvelles colonnes ---
+    # Les colonnes sont nommées directement 'reponse_1', 'reponse_2', ...
+    participants = pd.MultiIndex.from_frame(df_responses[cles_participant].iloc[premieres_lignes])
+    df_pivot = pd.DataFrame(
+        reponses,
+        index=participants,
+        columns=[f'reponse_{i + 1}' for i in range(reponses.shape[1])]
     ).reset_index()
 
-
-    # --- 4. Renommer les nouvelles colonnes ---
-    # Le pivot crée des colonnes nommées 0, 1, 2, ...
-    # On les renomme pour plus de clarté.
-    
-    # Crée un dictionnaire pour le renommage, ex: {0: 'reponse_1', 1: 'reponse_2', ...}
-    rename_dict = {col: f'reponse_{int(col) + 1}' for col in df_pivot.columns if isinstance(col, int)}
-    df_pivot.rename(columns=rename_dict, inplace=True)
-
     print("--- Tableau après pivot et renommage ---")
     print(df_pivot.head())
 
@@ -54,8 +64,7 @@ try:
     # On fusionne les informations uniques avec notre tableau pivoté
     df_final = pd.merge(df_unique_participants, df_pivot, on=['nom_du_participant', 'email'])
 
-    print("
---- Tableau final fusionné ---")
+    print("\n--- Tableau final fusionné ---")
     print(df_final.head())
 
 
@@ -1,29 +1,37 @@
 import pandas as pd
+import numpy as np
 import os
+import secrets
 
-def tirer_au_sort_excel(fichier_entree, fichier_gagnants, nb_gagnants=1, col_ticket='numéro_ticket'):
+from src.io_utils import append_parquet_dataset, cached_read_excel, fast_write_xlsx, read_parquet_dataset
+
+# Graine tirée une seule fois au chargement et affichée à chaque tirage (traçabilité)
+SEED = secrets.randbits(128)
+RNG = np.random.default_rng(SEED)
+
+def tirer_au_sort_excel(fichier_entree, fichier_gagnants, nb_gagnants=1, col_ticket='numero_ticket'):
     """
     Réalise un tirage au sort à partir d'un fichier Excel avec un nombre de gagnants spécifié.
 
     Args:
         fichier_entree (str): Le chemin du fichier Excel contenant tous les participants.
-        fichier_gagnants (str): Le chemin du fichier Excel où les gagnants sont enregistrés.
+        fichier_gagnants (str): Le chemin du dossier (dataset Parquet) où les gagnants sont enregistrés.
         nb_gagnants (int): Le nombre de gagnants à tirer.
         col_ticket (str): Le nom de la colonne contenant l'identifiant unique du ticket.
     """
     # 1. Charger les participants depuis le fichier d'entrée
     try:
-        df_entree = pd.read_excel(fichier_entree)
+        df_entree = cached_read_excel(fichier_entree)
     except FileNotFoundError:
         print(f"Erreur : Le fichier d'entrée '{fichier_entree}' n'a pas été trouvé.")
         return None
 
     # 2. Charger les gagnants existants pour les exclure du tirage
-    tickets_gagnants_existants = []
+    tickets_gagnants_existants = pd.Index([])
     if os.path.exists(fichier_gagnants):
-        df_gagnants_existants = pd.read_excel(fichier_gagnants)
+        df_gagnants_existants = read_parquet_dataset(fichier_gagnants)
         if not df_gagnants_existants.empty:
-            tickets_gagnants_existants = df_gagnants_existants[col_ticket].tolist()
+            tickets_gagnants_existants = pd.Index(df_gagnants_existants[col_ticket].to_numpy())
 
     # 3. Filtrer les participants pour ne garder que les éligibles
     df_eligibles = df_entree[~df_entree[col_ticket].isin(tickets_gagnants_existants)]
@@ -34,22 +42,21 @@ def tirer_au_sort_excel(fichier_entree, fichier_gagnants, nb_gagnants=1, col_tic
         return None
 
     # 4. Tirer au sort les nouveaux gagnants
-    df_nouveaux_gagnants = df_eligibles.sample(n=nb_gagnants)
-
-    # 5. Combiner les anciens et les nouveaux gagnants
-    if 'df_gagnants_existants' in locals() and not df_gagnants_existants.empty:
-        df_final_gagnants = pd.concat([df_gagnants_existants, df_nouveaux_gagnants], ignore_index=True)
-    else:
-        df_final_gagnants = df_nouveaux_gagnants
+    indices_gagnants = RNG.choice(len(df_eligibles), size=nb_gagnants, replace=False)
+    df_nouveaux_gagnants = df_eligibles.take(indices_gagnants)
 
-    # 6. Enregistrer la liste complète des gagnants dans le fichier de sortie
-    df_final_gagnants.to_excel(fichier_gagnants, index=False)
+    # 5. Ajouter les nouveaux gagnants au dataset Parquet : un fichier de plus par
+    # tirage, sans réécrire les gagnants précédents
+    append_parquet_dataset(df_nouveaux_gagnants, fichier_gagnants)
 
+    print(f"Graine du tirage : {SEED}")
     print(f"🎉 Les {nb_gagnants} nouveaux gagnants sont :")
-    for index, gagnant in df_nouveaux_gagnants.iterrows():
-        # On essaie de trouver une colonne 'nom', sinon on affiche juste le ticket
-        nom_gagnant = gagnant.get('nom', '[Nom non trouvé]')
-        print(f" - {nom_gagnant} avec le ticket {gagnant[col_ticket]}")
+    # On essaie de trouver une colonne 'nom', sinon on affiche juste le ticket
+    noms = df_nouveaux_gagnants.get(
+        'nom', pd.Series(['[Nom non trouvé]'] * len(df_nouveaux_gagnants))
+    ).to_numpy()
+    tickets = df_nouveaux_gagnants[col_ticket].to_numpy()
+    print('\n'.join(f" - {nom} avec le ticket TICKET-{ticket}" for nom, ticket in zip(noms, tickets)))
 
     print(f"\nLa liste complète des gagnants a été mise à jour dans '{fichier_gagnants}'.")
     return df_nouveaux_gagnants
@@ -60,8 +67,8 @@ def main():
     """
     # Définissez les noms de vos fichiers Excel
     nom_fichier_participants = "participants.xlsx"
-    nom_fichier_gagnants = "gagnants.xlsx"
-    colonne_id_ticket = "numéro_ticket" # Assurez-vous que ce nom de colonne est correct
+    nom_fichier_gagnants = "gagnants.parquet"
+    colonne_id_ticket = "numero_ticket" # Assurez-vous que ce nom de colonne est correct
 
     # Crée un fichier de participants pour le test s'il n'existe pas
     if not os.path.exists(nom_fichier_participants):
@@ -69,9 +76,10 @@ def main():
         test_data = {
             'nom': [f'Participant {i}' for i in range(1, 21)],
             'mail': [f'participant{i}@example.com' for i in range(1, 21)],
-            'numéro_ticket': [f'TICKET-{100+i}' for i in range(1, 21)]
+            # Identifiants numériques (int64) : le libellé 'TICKET-xxx' n'est construit qu'à l'affichage
+            'numero_ticket': np.arange(101, 121, dtype=np.int64)
         }
-        pd.DataFrame(test_data).to_excel(nom_fichier_participants, index=False)
+        fast_write_xlsx(pd.DataFrame(test_data), nom_fichier_participants)
 
 
     # Demander à l'utilisateur le nombre de gagnants à tirer
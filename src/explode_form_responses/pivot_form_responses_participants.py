@@ -1,15 +1,19 @@
 import os
 from datetime import datetime
 
+import numpy as np
 import pandas as pd
 from loguru import logger
 
+from src.io_utils import cached_read_excel, fast_write_xlsx
 
-def load_and_fill_na_data(file_path):
+
+def load_and_fill_na_data(file_path, columns=None):
     """_summary_
 
     Args:
         file_path (_type_): _description_
+        columns (list, optional): Colonnes à charger (toutes par défaut).
 
     Returns:
         _type_: _description_
@@ -17,19 +21,23 @@ def load_and_fill_na_data(file_path):
     """
 
     
-    # Charger les données
-    df = pd.read_excel(file_path)
+    # Charger les données (via le cache Parquet)
+    df = cached_read_excel(file_path, columns=columns)
 
-    # Afficher les premières lignes pour vérifier le chargement
-    logger.info("Aperçu des données chargées :")
-    logger.info(df.head())
-    logger.info(f"Colonnes initiales : {df.columns.tolist()}")
+    # Afficher les premières lignes pour vérifier le chargement (en DEBUG, de façon
+    # paresseuse : le repr du DataFrame n'est calculé que si ce niveau est actif)
+    logger.opt(lazy=True).debug("Aperçu des données chargées :\n{}", lambda: df.head())
+    logger.opt(lazy=True).debug("Colonnes initiales : {}", lambda: df.columns.tolist())
     logger.info(f"Nombre de lignes avant remplissage : {len(df)}")
     
     
     
+    # Identifiants en category : le remplissage propage des codes entiers
+    for col in ("nom_du_participant", "email"):
+        df[col] = df[col].astype("category")
+
     # Remplir les valeurs NaN en utilisant la méthode 'ffill' (forward fill)
-    df_filled = df.fillna(method='ffill')
+    df_filled = df.ffill()
 
     return df_filled
 
@@ -43,13 +51,33 @@ def group_data_by_nam_email(df_filled):
     Returns:
         _type_: _description_
     """
-    df_responses = df_filled[
-        ["nom_du_participant", "email", "reponses_des_participants"]
-    ].copy()
-    df_responses.dropna(subset=["reponses_des_participants"], inplace=True)
-    df_responses["num_reponse"] = df_responses.groupby(
-        ["nom_du_participant", "email"]
-    ).cumcount()
+    colonnes = ["nom_du_participant", "email", "reponses_des_participants"]
+    codes_nom, _ = pd.factorize(df_filled["nom_du_participant"])
+    codes_email, emails = pd.factorize(df_filled["email"])
+
+    # Les lignes sans participant identifié sont ignorées (le pivot les écartait déjà)
+    masque = (
+        (codes_nom >= 0)
+        & (codes_email >= 0)
+        & df_filled["reponses_des_participants"].notna().to_numpy()
+    )
+
+    # Numéro du participant : clé entière (nom, email), numérotée par ordre d'apparition
+    cle = codes_nom[masque].astype(np.int64) * len(emails) + codes_email[masque]
+    num_participant, _ = pd.factorize(cle)
+
+    # Numéro de réponse : rang de la ligne dans son groupe, obtenu par un tri stable
+    # puis en retranchant le début de chaque groupe (équivalent de cumcount)
+    ordre = np.argsort(num_participant, kind="stable")
+    tailles = np.bincount(num_participant)
+    debuts = np.cumsum(tailles) - tailles
+    num_reponse = np.empty_like(num_participant)
+    num_reponse[ordre] = np.arange(len(ordre)) - np.repeat(debuts, tailles)
+
+    # Une seule allocation pour le tableau filtré
+    df_responses = pd.DataFrame({col: df_filled[col].array[masque] for col in colonnes})
+    df_responses["num_participant"] = num_participant
+    df_responses["num_reponse"] = num_reponse
 
     return df_responses
 
@@ -63,20 +91,27 @@ def pivot_responses(df_responses):
     Returns:
         _type_: _description_
     """
-    # Pivotement pour transformer les réponses en colonnes distinctes
-    df_pivot = df_responses.pivot_table(
-        index=["nom_du_participant", "email"],
-        columns="num_reponse",
-        values="reponses_des_participants",
-        aggfunc="first",
+    # Pivotement : chaque réponse est placée directement à (participant, numéro de réponse)
+    # dans un tableau 2D pré-alloué, sans refaire de regroupement
+    num_reponse = df_responses["num_reponse"].to_numpy()
+    _, first_rows, row_idx = np.unique(
+        df_responses["num_participant"].to_numpy(), return_index=True, return_inverse=True
+    )
+    n_reponses = int(num_reponse.max()) + 1 if num_reponse.size else 0
+    reponses = np.full((len(first_rows), n_reponses), np.nan, dtype=object)
+    reponses[row_idx, num_reponse] = df_responses["reponses_des_participants"].to_numpy()
+
+    # Colonnes nommées directement pour une meilleure lisibilité
+    participants = df_responses[["nom_du_participant", "email"]].iloc[first_rows]
+    df_pivot = pd.DataFrame(
+        reponses,
+        index=pd.MultiIndex.from_frame(participants),
+        columns=[f"reponse_{i + 1}" for i in range(n_reponses)],
     ).reset_index()
+    # Même ordre de lignes que pivot_table : participants triés par (nom, email)
+    df_pivot = df_pivot.sort_values(["nom_du_participant", "email"], kind="stable", ignore_index=True)
 
-    # Renommer les colonnes pour une meilleure lisibilité
-    rename_dict = {col: f"reponse_{int(col) + 1}" for col in df_pivot.columns if isinstance(col, int)}
-    df_pivot.rename(columns=rename_dict, inplace=True)
-
-    logger.info("--- Tableau après pivot et renommage ---")
-    logger.info(df_pivot.head())
+    logger.opt(lazy=True).debug("--- Tableau après pivot et renommage ---\n{}", lambda: df_pivot.head())
 
     return df_pivot
 
@@ -95,13 +130,16 @@ def pivot_table_and_save_to_excel():
                                     "event_registration_pivot.xlsx")
     
     if output_file:
-        df_filled = load_and_fill_na_data(output_file)      
+        df_filled = load_and_fill_na_data(
+            output_file,
+            columns=["nom_du_participant", "email", "reponses_des_participants"],
+        )
         df_responses = group_data_by_nam_email(df_filled)    
         df_pivot = pivot_responses(df_responses)
-        df_pivot.to_excel(
+        fast_write_xlsx(
+                        df_pivot,
                         output_file_pivot 
                         + str(datetime.now().strftime("%H-%M-%S"))
                         + ".xlsx",
-                        index=False
                         )
         logger.info(f"Saved pivoted data to '{output_file_pivot}'.")
@@ -0,0 +1,147 @@
+import glob
+import hashlib
+import os
+import time
+
+import pandas as pd
+import pyarrow as pa
+import pyarrow.parquet as pq
+from loguru import logger
+
+CACHE_DIR_NAME = ".cache"
+# Bump when the readers change, so entries parsed by an older reader are rebuilt
+CACHE_VERSION = b"3"
+
+
+def cached_read_excel(file_path, columns=None, reader=pd.read_excel):
+    """
+    Reads an Excel file through a Parquet cache keyed by the file's content hash.
+
+    The first read parses the workbook with `reader` and stores it as
+    '.cache/<name>-<hash>.parquet' next to the source file; later reads of
+    unchanged content load the Parquet copy instead. Raises FileNotFoundError
+    like pd.read_excel when the file does not exist.
+    """
+    with open(file_path, "rb") as f:
+        digest = hashlib.blake2b(f.read(), digest_size=16, salt=CACHE_VERSION).hexdigest()
+
+    base_name = os.path.splitext(os.path.basename(file_path))[0]
+    cache_dir = os.path.join(os.path.dirname(os.path.abspath(file_path)), CACHE_DIR_NAME)
+    cache_path = os.path.join(cache_dir, f"{base_name}-{digest}.parquet")
+
+    if os.path.exists(cache_path):
+        return pd.read_parquet(cache_path, engine="pyarrow", columns=columns)
+
+    df = reader(file_path)
+
+    # Drop the cache entries of previous versions of this file
+    os.makedirs(cache_dir, exist_ok=True)
+    stale_pattern = f"{glob.escape(base_name)}-{'[0-9a-f]' * 32}.parquet"
+    for stale_path in glob.glob(os.path.join(cache_dir, stale_pattern)):
+        os.remove(stale_path)
+
+    tmp_path = cache_path + ".tmp"
+    try:
+        df.to_parquet(tmp_path, engine="pyarrow", compression="zstd", index=False)
+        os.replace(tmp_path, cache_path)
+    except (pa.ArrowException, ValueError) as e:
+        logger.warning(f"Could not cache '{file_path}' as Parquet. Error: {e}")
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
+
+    return df if columns is None else df[columns]
+
+
+def fast_write_xlsx(df, file_path):
+    """
+    Writes a DataFrame to an .xlsx file with the XlsxWriter engine.
+
+    XlsxWriter is much faster than the default openpyxl writer. Strings that
+    look like URLs are kept as plain text. 'constant_memory' is not enabled:
+    pandas writes cells column by column, which that mode does not support.
+    """
+    with pd.ExcelWriter(
+        file_path,
+        engine="xlsxwriter",
+        engine_kwargs={"options": {"strings_to_urls": False}},
+    ) as writer:
+        df.to_excel(writer, index=False)
+
+
+def append_parquet_dataset(df, root_path):
+    """
+    Appends a DataFrame to the Parquet dataset stored in the 'root_path' directory.
+
+    Each call adds one new file; the rows already stored are neither read nor
+    rewritten. File names start with a zero-padded nanosecond timestamp, so
+    sorting them gives the append order. Object columns mixing several
+    Python types (e.g. phone numbers read as int and str) are stored as
+    strings, since Arrow cannot build a column from them.
+    """
+    table = pa.Table.from_pandas(_stringify_mixed_columns(df), preserve_index=False)
+    os.makedirs(root_path, exist_ok=True)
+    file_path = os.path.join(root_path, f"part-{time.time_ns():020d}.parquet")
+    pq.write_table(table, file_path, compression="zstd")
+
+
+def _stringify_mixed_columns(df):
+    """
+    Returns 'df' with its mixed-type object columns cast to str; missing
+    values are kept. The caller's DataFrame is left untouched.
+    """
+    mixed = [
+        col for col in df.columns[(df.dtypes == object).to_numpy()]
+        if df[col].dropna().map(type).nunique() > 1
+    ]
+    if not mixed:
+        return df
+    df = df.copy(deep=False)
+    for col in mixed:
+        values = df[col]
+        df[col] = values.where(values.isna(), values.astype(str))
+    return df
+
+
+def _unify_tables(tables):
+    """
+    Concatenates tables whose column types may differ from one file to another.
+
+    A column that is text in some files and numeric or all-null in others
+    (e.g. an empty Excel column read as float NaN) is cast to string; other
+    differences (null vs typed, int vs float, missing columns) are handled by
+    Arrow's permissive promotion.
+    """
+    types = {}
+    for table in tables:
+        for field in table.schema:
+            types.setdefault(field.name, set()).add(field.type)
+    text_columns = {
+        name for name, column_types in types.items()
+        if len(column_types) > 1
+        and any(pa.types.is_string(t) or pa.types.is_large_string(t) for t in column_types)
+    }
+
+    unified = []
+    for table in tables:
+        # pandas metadata describes each file's own dtypes: drop it before merging
+        table = table.replace_schema_metadata(None)
+        for i, field in enumerate(table.schema):
+            if field.name in text_columns and not pa.types.is_string(field.type):
+                table = table.set_column(i, field.name, table.column(i).cast(pa.string()))
+        unified.append(table)
+    return pa.concat_tables(unified, promote_options="permissive")
+
+
+def read_parquet_dataset(root_path):
+    """
+    Reads every file of the Parquet dataset in 'root_path' into one DataFrame,
+    in append order.
+    """
+    with os.scandir(root_path) as entries:
+        paths = sorted(
+            entry.path for entry in entries
+            if entry.name.endswith(".parquet") and not entry.name.startswith((".", "_"))
+        )
+    if not paths:
+        return pd.DataFrame()
+    return _unify_tables([pq.read_table(path) for path in paths]).to_pandas()
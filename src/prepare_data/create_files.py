@@ -1,9 +1,27 @@
 import os
+import re
+import unicodedata
+from itertools import islice
+from pathlib import Path
 import pandas as pd
 import numpy as np
-import janitor
 from loguru import logger
 
+from src.io_utils import cached_read_excel, fast_write_xlsx
+
+# Regex compilées une seule fois au chargement du module
+# Un groupe capturant par catégorie de ticket : Visiteur, Benevole, Commanditaire.
+# Chaque groupe est une anticipation ancrée en début de texte : les trois mots sont
+# cherchés indépendamment, l'ordre des groupes donne la priorité (et non leur
+# position dans le texte, ex. "Bénévole + visiteur" reste un ticket Visiteur).
+TICKET_CATEGORY_PATTERN = re.compile(
+    r'^(?=.*(visiteur))?(?=.*(b[eé]n[eé]vole))?(?=.*(commanditaire))?',
+    re.IGNORECASE | re.DOTALL,
+)
+COLUMN_SEPARATOR_PATTERN = re.compile(r"[ /:,?()\.\-\xa0]")
+COLUMN_APOSTROPHE_PATTERN = re.compile(r"['’]")
+COLUMN_UNDERSCORES_PATTERN = re.compile(r"_+")
+
 # --- 1. Logging Configuration ---
 
 def setup_logging():
@@ -42,13 +60,18 @@ def find_and_prepare_input_file(input_dir, target_filename="event_registration.x
         logger.error(f"Input directory '{input_dir}' was not found. It has been created. Please add an Excel file and rerun.")
         return None
 
-    files_in_dir = [f for f in os.listdir(input_dir) if os.path.isfile(os.path.join(input_dir, f)) and f.endswith((".xlsx", ".xls"))]
+    # Parcours paresseux : on s'arrête dès qu'un second fichier Excel est trouvé
+    excel_files = (
+        path.name for path in Path(input_dir).glob("*.xls*")
+        if path.suffix in (".xlsx", ".xls") and path.is_file()
+    )
+    files_in_dir = list(islice(excel_files, 2))
 
     if len(files_in_dir) == 0:
         logger.error(f"No Excel files found in '{input_dir}'.")
         return None
     elif len(files_in_dir) > 1:
-        logger.error(f"Multiple files found in '{input_dir}'. Only one is allowed. Files: {files_in_dir}")
+        logger.error(f"Multiple files found in '{input_dir}'. Only one is allowed. Files found include: {files_in_dir}")
         return None
 
     original_filename = files_in_dir[0]
@@ -63,6 +86,24 @@ def find_and_prepare_input_file(input_dir, target_filename="event_registration.x
 
     return target_filepath
 
+def clean_column_names(columns):
+    """
+    Normalizes column names the way janitor's clean_names() does:
+    surrounding whitespace trimmed, lowercase, separators replaced by
+    underscores, apostrophes removed, accents stripped and repeated
+    underscores collapsed (e.g. "Ticket d'événement" -> "ticket_devenement",
+    "Société / Entreprise" -> "societe_entreprise").
+    """
+    cleaned = []
+    for name in columns:
+        name = str(name).strip().lower()
+        name = COLUMN_SEPARATOR_PATTERN.sub("_", name)
+        name = COLUMN_APOSTROPHE_PATTERN.sub("", name)
+        name = "".join(c for c in unicodedata.normalize("NFD", name) if not unicodedata.combining(c))
+        name = COLUMN_UNDERSCORES_PATTERN.sub("_", name)
+        cleaned.append(name)
+    return cleaned
+
 def load_and_clean_data(file_path):
     """
     Reads an Excel file, cleans column names, removes empty rows/columns,
@@ -71,10 +112,14 @@ def load_and_clean_data(file_path):
     if not file_path:
         return None
     try:
-        df = pd.read_excel(file_path)
+        df = cached_read_excel(file_path)
         logger.info(f"Successfully loaded '{file_path}'.")
-        df["numéro_ticket"] = np.arange(1, len(df) + 1)
-        df_cleaned = df.clean_names().remove_empty()
+        df["numero_ticket"] = np.arange(1, len(df) + 1, dtype=np.int64)
+        df.columns = clean_column_names(df.columns)
+
+        # Un seul calcul du masque des valeurs manquantes pour les lignes et les colonnes
+        missing = df.isna().to_numpy()
+        df_cleaned = df.iloc[~missing.all(axis=1), ~missing.all(axis=0)].reset_index(drop=True)
         logger.success("Column names cleaned and empty rows/columns removed.")
         return df_cleaned
     except Exception as e:
@@ -93,15 +138,16 @@ def normalize_ticket_column(df):
         logger.warning("Colonne 'ticket_devenement' non trouvée.")
         return df
 
-    s = df['ticket_devenement'].astype(str).str.lower()
+    # Un seul passage regex : chaque groupe capturant correspond à une catégorie,
+    # argmax retient la première trouvée dans l'ordre de priorité
+    matches = df['ticket_devenement'].astype(str).str.extract(TICKET_CATEGORY_PATTERN).notna().to_numpy()
 
-    conditions = [
-        s.str.contains('visiteur'),
-        s.str.contains('bénévole|benevole'),
-        s.str.contains('commanditaire')
-    ]
-    choices = ['Visiteur', 'Benevole', 'Commanditaire']
-    df['ticket_devenement'] = np.select(conditions, choices, default='Autre')
+    choices = np.array(['Visiteur', 'Benevole', 'Commanditaire'])
+    categories = np.where(matches.any(axis=1), choices[matches.argmax(axis=1)], 'Autre')
+    # Type category : codes int8 au lieu d'un objet Python par cellule
+    df['ticket_devenement'] = pd.Categorical(
+        categories, categories=['Visiteur', 'Benevole', 'Commanditaire', 'Autre']
+    )
     
     logger.success(f"Ticket column normalized. Unique values: {df['ticket_devenement'].unique().tolist()}")
     return df
@@ -110,7 +156,7 @@ def clean_status_column(df):
     """Cleans the 'status' column by normalizing its values."""
     logger.info("Cleaning 'status' column...")
     df["status"] = df["status"].fillna("absent").astype(str).str.strip()
-    df["status"] = df["status"].replace({"Présent": "present", "Inscrit": "inscrit"})
+    df["status"] = df["status"].replace({"Présent": "present", "Inscrit": "inscrit"}).astype("category")
     logger.success(f"Status column cleaned. Unique values: {df['status'].unique().tolist()}")
     return df
 
@@ -126,7 +172,7 @@ def filter_and_save_participants(df, output_dir):
     os.makedirs(output_dir, exist_ok=True)
     
     cleaned_output_path = os.path.join(output_dir, "event_registration_cleaned.xlsx")
-    df.to_excel(cleaned_output_path, index=False)
+    fast_write_xlsx(df, cleaned_output_path)
     logger.success(f"Full cleaned and processed file saved to '{cleaned_output_path}'.")
 
     participant_filters = {
@@ -135,17 +181,22 @@ def filter_and_save_participants(df, output_dir):
         "visiteurs": "Visiteur",
     }
 
+    # Un seul filtre sur le statut, puis un seul groupby pour répartir par ticket
+    df_all_present = df[df["status"] == "present"]
+    present_by_ticket = dict(
+        tuple(df_all_present.groupby("ticket_devenement", observed=True, sort=False))
+    )
+
     for role, ticket_name in participant_filters.items():
         logger.info(f"Filtering for present '{role}' (ticket: '{ticket_name}')...")
         
-        mask = (df["ticket_devenement"] == ticket_name) & (df["status"] == "present")
-        df_present = df[mask]
+        df_present = present_by_ticket.get(ticket_name, df_all_present.iloc[0:0])
 
         count = len(df_present)
         logger.success(f"Found {count} present participants for role '{role}'.")
 
         output_path = os.path.join(output_dir, f"event_registration_{role}.xlsx")
-        df_present.to_excel(output_path, index=False)
+        fast_write_xlsx(df_present, output_path)
         logger.success(f"Saved '{role}' data to '{output_path}'.")
 
 # --- 4. Main Execution ---
@@ -1,68 +1,108 @@
 import pandas as pd
 import numpy as np
 import os
+import secrets
+import sys
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 
-def load_and_concatenate_participants(visiteurs_path, benevoles_path, sponsors_path):
-    """
-    Loads participants from 'visiteurs', 'benevoles', and 'sponsors' Excel files and concatenates them.
-    """
-    df_visiteurs = pd.DataFrame()
-    df_benevoles = pd.DataFrame()
-    df_sponsors = pd.DataFrame()
+from src.io_utils import append_parquet_dataset, cached_read_excel, fast_write_xlsx, read_parquet_dataset
 
-    try:
-        df_visiteurs = pd.read_excel(visiteurs_path)
-        print(f"Fichier '{visiteurs_path}' chargé avec {len(df_visiteurs)} lignes.")
-    except FileNotFoundError:
-        print(f"AVERTISSEMENT : Le fichier des visiteurs '{visiteurs_path}' n'a pas été trouvé.")
+# Graine tirée une seule fois au chargement et affichée à chaque tirage (traçabilité)
+SEED = secrets.randbits(128)
+RNG = np.random.default_rng(SEED)
 
-    try:
-        df_benevoles = pd.read_excel(benevoles_path)
-        print(f"Fichier '{benevoles_path}' chargé avec {len(df_benevoles)} lignes.")
-    except FileNotFoundError:
-        print(f"AVERTISSEMENT : Le fichier des bénévoles '{benevoles_path}' n'a pas été trouvé.")
+# Déterminer la racine du projet de manière dynamique
+PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+OUTPUT_DIR = os.path.join(PROJECT_ROOT, "output_files")
+# Les gagnants cumulés sont conservés dans un dataset Parquet (un fichier ajouté par
+# tirage) ; l'Excel n'est produit qu'à l'export
+WINNERS_STORE = os.path.join(OUTPUT_DIR, "gagnants_combines.parquet")
+# Ancien historique Excel : repris une fois dans le dataset, jamais réécrit
+LEGACY_WINNERS_XLSX = os.path.join(OUTPUT_DIR, "gagnants_combines.xlsx")
+WINNERS_XLSX = os.path.join(OUTPUT_DIR, "gagnants_combines_export.xlsx")
 
-    try:
-        df_sponsors = pd.read_excel(sponsors_path)
-        print(f"Fichier '{sponsors_path}' chargé avec {len(df_sponsors)} lignes.")
-    except FileNotFoundError:
-        print(f"AVERTISSEMENT : Le fichier des sponsors '{sponsors_path}' n'a pas été trouvé.")
+def seed_winners_store(winners_store=WINNERS_STORE, legacy_xlsx=LEGACY_WINNERS_XLSX):
+    """
+    Seeds the Parquet winners store from the legacy Excel history on first run,
+    so that previous winners stay ineligible.
+    """
+    if os.path.exists(winners_store) or not os.path.exists(legacy_xlsx):
+        return
+    df_historique = pd.read_excel(legacy_xlsx)
+    if df_historique.empty:
+        return
+    append_parquet_dataset(df_historique, winners_store)
+    print(f"{len(df_historique)} gagnants repris de '{legacy_xlsx}' dans '{winners_store}'.")
 
-    df_entree = pd.concat([df_visiteurs, df_benevoles, df_sponsors], ignore_index=True)
+def load_and_concatenate_participants(visiteurs_path, benevoles_path, sponsors_path):
+    """
+    Loads participants from 'visiteurs', 'benevoles', and 'sponsors' Excel files and concatenates them.
+    """
+    fichiers = [
+        ("visiteurs", visiteurs_path),
+        ("bénévoles", benevoles_path),
+        ("sponsors", sponsors_path),
+    ]
+
+    # Les lectures sont indépendantes : elles se chevauchent dans des threads,
+    # les messages sont ensuite affichés dans l'ordre des fichiers.
+    with ThreadPoolExecutor(max_workers=len(fichiers)) as executor:
+        futurs = [executor.submit(cached_read_excel, chemin) for _, chemin in fichiers]
+
+    dataframes = []
+    for (libelle, chemin), futur in zip(fichiers, futurs):
+        try:
+            df = futur.result()
+            print(f"Fichier '{chemin}' chargé avec {len(df)} lignes.")
+            dataframes.append(df)
+        except FileNotFoundError:
+            print(f"AVERTISSEMENT : Le fichier des {libelle} '{chemin}' n'a pas été trouvé.")
+
+    df_entree = pd.concat(dataframes, ignore_index=True) if dataframes else pd.DataFrame()
     print(f"\nTotal de {len(df_entree)} participants après concaténation.")
     return df_entree
 
-def get_ineligible_participants(winners_file_path, name_column='nom', role_column='ticket_devenement'):
+def _analyze_winners(winners_file_path, name_column, role_column):
     """
-    Analyzes the winners file to determine who is no longer eligible to win.
-    - Non-volunteers can win once.
-    - Volunteers can win twice.
-    Returns a list of names of ineligible people and the existing winners DataFrame.
+    Computes the ineligible people from the winners store without printing anything,
+    so that it can run in a worker thread.
+    Returns the ineligible names, the existing winners DataFrame and the messages to display.
     """
     if not os.path.exists(winners_file_path):
-        print("\nAucun fichier de gagnants existant. Tout le monde est éligible.")
-        return [], None
+        return [], None, ["\nAucun fichier de gagnants existant. Tout le monde est éligible."]
 
-    df_gagnants_existants = pd.read_excel(winners_file_path)
+    df_gagnants_existants = read_parquet_dataset(winners_file_path)
     if df_gagnants_existants.empty:
-        return [], df_gagnants_existants
+        return [], df_gagnants_existants, []
 
     if name_column not in df_gagnants_existants.columns or role_column not in df_gagnants_existants.columns:
-        print(f"AVERTISSEMENT : Les colonnes '{name_column}' ou '{role_column}' sont manquantes dans le fichier des gagnants.")
-        return [], df_gagnants_existants
-
-    gagnants_benevoles = df_gagnants_existants[df_gagnants_existants[role_column] == 'Benevole']
-    gagnants_autres = df_gagnants_existants[df_gagnants_existants[role_column] != 'Benevole']
-
-    personnes_a_exclure_autres = gagnants_autres[name_column].unique().tolist()
-
-    wins_par_benevole = gagnants_benevoles[name_column].value_counts()
-    benevoles_a_exclure = wins_par_benevole[wins_par_benevole >= 2].index.tolist()
-
-    personnes_ineligibles = list(set(personnes_a_exclure_autres + benevoles_a_exclure))
+        return [], df_gagnants_existants, [
+            f"AVERTISSEMENT : Les colonnes '{name_column}' ou '{role_column}' sont manquantes dans le fichier des gagnants."
+        ]
+
+    # Comptage des gains par personne sur des codes entiers (noms factorisés)
+    codes_noms, noms = pd.factorize(df_gagnants_existants[name_column])
+    est_benevole = (df_gagnants_existants[role_column] == 'Benevole').to_numpy()
+    nom_connu = codes_noms >= 0  # -1 : nom manquant
+    gains_benevole = np.bincount(codes_noms[nom_connu & est_benevole], minlength=len(noms))
+    gains_autres = np.bincount(codes_noms[nom_connu & ~est_benevole], minlength=len(noms))
+    personnes_ineligibles = noms[(gains_autres > 0) | (gains_benevole >= 2)].to_numpy()
     
-    print(f"\n{len(personnes_ineligibles)} personnes sont inéligibles pour ce tirage (gains précédents).")
+    return personnes_ineligibles, df_gagnants_existants, [
+        f"\n{len(personnes_ineligibles)} personnes sont inéligibles pour ce tirage (gains précédents)."
+    ]
+
+def get_ineligible_participants(winners_file_path, name_column='nom', role_column='ticket_devenement'):
+    """
+    Analyzes the winners file to determine who is no longer eligible to win.
+    - Non-volunteers can win once.
+    - Volunteers can win twice.
+    Returns an array of names of ineligible people and the existing winners DataFrame.
+    """
+    personnes_ineligibles, df_gagnants_existants, messages = _analyze_winners(winners_file_path, name_column, role_column)
+    for message in messages:
+        print(message)
     return personnes_ineligibles, df_gagnants_existants
 
 def main():
@@ -70,34 +110,39 @@ def main():
     Main function to run the lottery draw with role-based rules.
     """
     # --- 1. Configuration ---
-    # Déterminer la racine du projet de manière dynamique
-    project_root = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
-    base_dir = project_root
-    output_dir = os.path.join(base_dir, "output_files")
+    fichier_visiteurs = os.path.join(OUTPUT_DIR, "event_registration_visiteurs.xlsx")
+    fichier_benevoles = os.path.join(OUTPUT_DIR, "event_registration_benevoles.xlsx")
+    fichier_sponsors = os.path.join(OUTPUT_DIR, "event_registration_sponsors.xlsx")
     
-    fichier_visiteurs = os.path.join(output_dir, "event_registration_visiteurs.xlsx")
-    fichier_benevoles = os.path.join(output_dir, "event_registration_benevoles.xlsx")
-    fichier_sponsors = os.path.join(output_dir, "event_registration_sponsors.xlsx")
-    
-    nom_fichier_gagnants = os.path.join(output_dir, "gagnants_combines.xlsx")
+    nom_fichier_gagnants = WINNERS_STORE
     
     colonne_nom = "nom_du_participant"
     colonne_role = "ticket_devenement"
     colonne_id_ticket = "numero_ticket"
 
     # --- 2. Load and Prepare Data ---
-    df_entree = load_and_concatenate_participants(fichier_visiteurs, fichier_benevoles, fichier_sponsors)
+    seed_winners_store(nom_fichier_gagnants)
+
+    # Le fichier des gagnants est lu en parallèle des fichiers de participants ; ses
+    # messages sont affichés ensuite, depuis le thread principal, pour ne pas s'entremêler
+    with ThreadPoolExecutor(max_workers=1) as executor:
+        futur_gagnants = executor.submit(_analyze_winners, nom_fichier_gagnants, colonne_nom, colonne_role)
+        df_entree = load_and_concatenate_participants(fichier_visiteurs, fichier_benevoles, fichier_sponsors)
+        personnes_ineligibles, df_gagnants_existants, messages_gagnants = futur_gagnants.result()
+    for message in messages_gagnants:
+        print(message)
+
     if df_entree.empty:
         print("Aucun participant à tirer au sort. Arrêt du script.")
         return
 
     # --- 3. Filter Eligible Participants ---
-    personnes_ineligibles, df_gagnants_existants = get_ineligible_participants(nom_fichier_gagnants, colonne_nom, colonne_role)
     
     df_eligibles = df_entree[~df_entree[colonne_nom].isin(personnes_ineligibles)]
 
     if df_gagnants_existants is not None and colonne_id_ticket in df_gagnants_existants.columns:
-        tickets_gagnants = df_gagnants_existants[colonne_id_ticket].tolist()
+        # Index directement construit sur le tableau numpy : pas de liste Python intermédiaire
+        tickets_gagnants = pd.Index(df_gagnants_existants[colonne_id_ticket].to_numpy())
         df_eligibles = df_eligibles[~df_eligibles[colonne_id_ticket].isin(tickets_gagnants)]
 
     print(f"\nNombre de tickets éligibles pour ce tirage : {len(df_eligibles)}")
@@ -120,20 +165,38 @@ def main():
         print(f"Il n'y a pas assez de participants éligibles ({len(df_eligibles)}) pour tirer {nb_gagnants_a_tirer} gagnants.")
         return
 
-    df_nouveaux_gagnants = df_eligibles.sample(n=nb_gagnants_a_tirer)
+    indices_gagnants = RNG.choice(len(df_eligibles), size=nb_gagnants_a_tirer, replace=False)
+    df_nouveaux_gagnants = df_eligibles.take(indices_gagnants)
     df_nouveaux_gagnants['heure_du_tirage'] = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
 
+    print(f"\nGraine du tirage : {SEED}")
     print(f"\n🎉 Les {nb_gagnants_a_tirer} nouveaux gagnants sont :")
     print(df_nouveaux_gagnants)
 
     # --- 5. Save Results ---
-    if df_gagnants_existants is not None and not df_gagnants_existants.empty:
-        df_final_gagnants = pd.concat([df_gagnants_existants, df_nouveaux_gagnants], ignore_index=True)
-    else:
-        df_final_gagnants = df_nouveaux_gagnants
-
-    df_final_gagnants.to_excel(nom_fichier_gagnants, index=False)
+    # Seuls les nouveaux gagnants sont écrits : l'historique n'est pas recopié
+    append_parquet_dataset(df_nouveaux_gagnants, nom_fichier_gagnants)
     print(f"\nLa liste complète des gagnants a été mise à jour dans '{nom_fichier_gagnants}'.")
 
+def export_winners_xlsx(winners_store=WINNERS_STORE, xlsx_path=WINNERS_XLSX):
+    """
+    Exports the accumulated winners from the Parquet store to an Excel file for publication.
+    """
+    seed_winners_store(winners_store)
+    if not os.path.exists(winners_store):
+        print(f"Aucun fichier de gagnants à exporter ('{winners_store}').")
+        return None
+
+    df_gagnants = read_parquet_dataset(winners_store)
+    fast_write_xlsx(df_gagnants, xlsx_path)
+    print(f"{len(df_gagnants)} gagnants exportés dans '{xlsx_path}'.")
+    return xlsx_path
+
 if __name__ == "__main__":
-    main()
+    # À lancer depuis la racine du projet (le paquet `src` doit être importable) :
+    #   python -m src.random_sort_visiteurs.run_lottery          -> tirage
+    #   python -m src.random_sort_visiteurs.run_lottery export   -> Excel final, sans tirage
+    if sys.argv[1:] == ["export"]:
+        export_winners_xlsx()
+    else:
+        main()